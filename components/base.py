@@ -1,19 +1,79 @@
+import contextlib
+import contextvars
 import dataclasses
+import functools
 import re
 
+from django.template import RequestContext, Template
+from django.template.context import BaseContext
 from django.utils.safestring import mark_safe
 from laces.components import Component
 
+from .compiler import UnsupportedTemplate, compile_template
+
+# Context flag set while rendering a component's template so that nested
+# components leave minification to the outermost render.
+SKIP_MINIFY = '_skip_minify'
+
+# Context of the component template currently rendering, per thread and per async task
+_render_context = contextvars.ContextVar('render_context', default=None)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_template(source):
+    """
+    Compile a template string once and reuse it for every render.
+    Component templates are class attributes, so the same source is parsed over and over otherwise.
+    """
+    return Template(source)
+
+
+@contextlib.contextmanager
+def _shared_context(context):
+    """
+    Expose ``context`` while a template renders to components that opt in with
+    ``inherit_render_context`` and are rendered with no parent context.
+    """
+    token = _render_context.set(context)
+    try:
+        yield context
+    finally:
+        _render_context.reset(token)
+
+
+def render_components(components, parent_context=None, before='', after=''):
+    """
+    Render child components in Python and join them into a single safe string.
+    ``before`` and ``after`` are safe html strings placed around each child.
+    Children never merge the parent's variables into their own, as with ``{% component x with ignore=True %}``.
+    """
+    child_data = {'ignore': True, SKIP_MINIFY: True}
+    if isinstance(parent_context, BaseContext):
+        with parent_context.push(child_data):
+            rendered = [component.render_html(parent_context) for component in components]
+    else:
+        context = {**(parent_context or {}), **child_data}
+        rendered = [component.render_html(context) for component in components]
+
+    if before or after:
+        return mark_safe(''.join(before + html + after for html in rendered))
+
+    return mark_safe(''.join(rendered))
+
 
 class TemplateStringComponent(Component):
 
     template: str = ''''''
 
+    # Render with no parent context as part of the template currently rendering, if any
+    inherit_render_context = False
+
     def get_template(self, fragments=None):
         return self.template
 
     def render_html(self, parent_context=None):
-        from django.template import Template, RequestContext
+        if parent_context is None and self.inherit_render_context:
+            parent_context = _render_context.get()
 
         fragments = parent_context.get('fragments', '') if parent_context else None
 
@@ -21,24 +81,98 @@ class TemplateStringComponent(Component):
 
         context_data = self.get_context_data(parent_context)
 
-        if not ignore_context:
-            context_data.update(parent_context.flatten() if parent_context and isinstance(parent_context, RequestContext) else parent_context or {})
+        is_request_context = isinstance(parent_context, RequestContext)
+
+        # Parent variables win over the component's own. A parent RequestContext already exposes the rest,
+        #  so only the names both define are copied rather than flattening it
+        if not ignore_context and is_request_context:
+            context_data.update({key: parent_context[key] for key in context_data if key in parent_context})
+        elif not ignore_context:
+            context_data.update(parent_context.flatten() if isinstance(parent_context, BaseContext) else parent_context)
+
+        source = self.get_template(fragments)
 
-        template = Template(self.get_template(fragments))
+        # Simple templates run as generated Python when every variable they read is in the context
+        compiled = compile_template(source)
+        if compiled is not None and compiled[1] <= context_data.keys():
+            render, _ = compiled
+            try:
+                return self.minify(render(context_data), parent_context)
+            except UnsupportedTemplate:
+                pass
 
-        # Get request from parent context if available
-        request = parent_context.get('request') if parent_context else None
+        template = _compile_template(source)
 
-        rendered_template = template.render(RequestContext(request, context_data))
-        minified_template = re.sub(r'\s+', ' ', rendered_template).strip()
+        context_data[SKIP_MINIFY] = True
+
+        if is_request_context and not ignore_context:
+            # Context processors already ran for the parent; render on a new layer of its stack
+            with parent_context.push(context_data), _shared_context(parent_context):
+                rendered_template = template.render(parent_context)
+        else:
+            # Get request from parent context if available
+            request = parent_context.get('request') if parent_context else None
+            with _shared_context(RequestContext(request, context_data)) as context:
+                rendered_template = template.render(context)
+
+        return self.minify(rendered_template, parent_context)
+
+    def minify(self, html, parent_context=None):
+        if parent_context and parent_context.get(SKIP_MINIFY):
+            return mark_safe(html)
+
+        # str.split() collapses whitespace runs and trims both ends in one C-level pass
+        minified_template = ' '.join(html.split())
         return mark_safe(minified_template)
 
 
+# Variable and block tags
+_TEMPLATE_TAG_RE = re.compile(r'\{\{.*?\}\}|\{%.*?%\}', re.DOTALL)
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*')
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls):
+    """Names of the class's dataclass fields."""
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _template_field_names(cls):
+    """
+    Names of the dataclass fields referenced by any of the class's ``*template`` attributes.
+    Falls back to every field when the class has no template strings to inspect.
+    """
+    field_names = _field_names(cls)
+
+    template_names = set()
+    seen = set()
+    # The first class in the MRO defining a name wins, as with getattr
+    for klass in cls.__mro__:
+        for attr, value in vars(klass).items():
+            if attr in seen or not attr.endswith('template'):
+                continue
+            seen.add(attr)
+            if not isinstance(value, str):
+                continue
+            for tag in _TEMPLATE_TAG_RE.findall(value):
+                template_names.update(_IDENTIFIER_RE.findall(tag))
+
+    if not template_names:
+        return field_names
+
+    return tuple(name for name in field_names if name in template_names)
+
 
 class AutoContextMixin:
+    # Only put the fields named in the class's ``*template`` attributes into the context.
+    # Leave off for components whose templates come from get_template() or elsewhere.
+    context_from_templates = False
+
     def get_context_data(self, parent_context=None):
-        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        names = _template_field_names(type(self)) if self.context_from_templates else _field_names(type(self))
+        return {name: getattr(self, name) for name in names}
 
 
 class AutoTemplateStringComponent(AutoContextMixin, TemplateStringComponent):
-    pass
\ No newline at end of file
+    pass
@@ -1,7 +1,9 @@
 import dataclasses
 from typing import List, Optional
 
-from .base import AutoTemplateStringComponent
+from django.utils.html import format_html
+
+from .base import AutoTemplateStringComponent, render_components
 
 
 @dataclasses.dataclass
@@ -47,18 +49,21 @@ class SummaryCard(AutoTemplateStringComponent):
     </div>
     '''
 
+    context_from_templates = True
+
 @dataclasses.dataclass
 class SummaryCardList(AutoTemplateStringComponent):
     cards: List[SummaryCard] = dataclasses.field(default_factory=list)
     card_class: Optional[str] = 'col-xl-3 col-md-6'
 
     template = '''
-    {% load laces %}
     <div class="row">
-        {% for card in cards %}
-            <div class="{{ card_class }}">
-                {% component card with ignore=True %}
-            </div>
-        {% endfor %}
+        {{ cards_html }}
     </div>
     '''
+
+    def get_context_data(self, parent_context=None):
+        context = super().get_context_data(parent_context)
+        before = format_html('<div class="{}">', self.card_class)
+        context['cards_html'] = render_components(self.cards, parent_context, before, '</div>')
+        return context
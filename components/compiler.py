@@ -0,0 +1,121 @@
+import functools
+import re
+
+from django.utils.formats import localize
+from django.utils.html import conditional_escape
+from django.utils.timezone import template_localtime
+
+# Same tokens as django.template.base.tag_re, which does not match tags spanning lines
+_TOKEN_RE = re.compile(r'(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})')
+# Django rejects variables starting with an underscore; those templates are left to it
+_VARIABLE_RE = re.compile(r'^\{\{\s*([A-Za-z]\w*)\s*(\|\s*safe\s*)?\}\}$')
+_IF_RE = re.compile(r'''^\{%\s*if\s+([A-Za-z]\w*)\s*(?:==\s*(?:'([^'\\]*)'|"([^"\\]*)")\s*)?%\}$''')
+_ELSE_RE = re.compile(r'^\{%\s*else\s*%\}$')
+_ENDIF_RE = re.compile(r'^\{%\s*endif\s*%\}$')
+
+
+class UnsupportedTemplate(Exception):
+    pass
+
+
+def _resolve(value):
+    # Django calls callables when resolving a variable; renders reaching one are left to it
+    if callable(value):
+        raise UnsupportedTemplate(value)
+    return value
+
+
+def _escape(value):
+    # As django.template.base.render_value_in_context with autoescaping on
+    return conditional_escape(localize(template_localtime(_resolve(value))))
+
+
+def _safe(value):
+    return str(_resolve(value))
+
+
+def _generate_source(source):
+    lines = ['def render(context):', '    out = []', '    append = out.append']
+    names = set()
+    indent = 1
+    # Number of statements emitted in each open block, to fill empty ones with 'pass'
+    blocks = []
+
+    def emit(statement):
+        lines.append('    ' * indent + statement)
+        if blocks:
+            blocks[-1] += 1
+
+    # split() alternates text and tags, so text that only looks like a tag stays text
+    for index, token in enumerate(_TOKEN_RE.split(source)):
+        if not token:
+            continue
+
+        if not index % 2:
+            emit(f'append({token!r})')
+            continue
+
+        if token.startswith('{#'):
+            continue
+
+        match = _VARIABLE_RE.match(token)
+        if match:
+            name, safe = match.groups()
+            names.add(name)
+            emit(f"append({'_safe' if safe else '_escape'}(context[{name!r}]))")
+            continue
+
+        match = _IF_RE.match(token)
+        if match:
+            name, single, double = match.groups()
+            names.add(name)
+            literal = single if single is not None else double
+            condition = f'_resolve(context[{name!r}])'
+            if literal is not None:
+                condition += f' == {literal!r}'
+            emit(f'if {condition}:')
+            indent += 1
+            blocks.append(0)
+            continue
+
+        if _ELSE_RE.match(token) and blocks:
+            if not blocks.pop():
+                lines.append('    ' * indent + 'pass')
+            lines.append('    ' * (indent - 1) + 'else:')
+            blocks.append(0)
+            continue
+
+        if _ENDIF_RE.match(token) and blocks:
+            if not blocks.pop():
+                lines.append('    ' * indent + 'pass')
+            indent -= 1
+            continue
+
+        raise UnsupportedTemplate(token)
+
+    if blocks:
+        raise UnsupportedTemplate('unclosed if')
+
+    lines.append("    return ''.join(out)")
+    return '\n'.join(lines), frozenset(names)
+
+
+@functools.lru_cache(maxsize=512)
+def compile_template(source):
+    """
+    Compile a simple template into a Python function taking a context dict, or return None.
+
+    Only ``{{ var }}``, ``{{ var|safe }}``, ``{% if var %}``, ``{% if var == 'text' %}``,
+    ``{% else %}``, ``{% endif %}`` and comments are supported, with plain variable names.
+    Returns a ``(render, names)`` pair where ``names`` are the variables the template reads.
+    ``render`` raises UnsupportedTemplate for a context holding a callable, which Django would call.
+    """
+    try:
+        code, names = _generate_source(source)
+    except UnsupportedTemplate:
+        return None
+
+    namespace = {'_escape': _escape, '_safe': _safe, '_resolve': _resolve}
+    exec(compile(code, '<component template>', 'exec'), namespace)
+
+    return namespace['render'], names
@@ -19,23 +19,28 @@ class UpdateAction(enum.Enum):
     UPDATE_BASKET = "update-basket"
     DELETE_ROW = "delete"
     ADD_ROW = "add"
+    BULK_ADD = "bulk-add"
 
     @property
     def is_cell(self):
-        return self.value == UpdateAction.UPDATE_CELL.value
+        return self is UpdateAction.UPDATE_CELL
 
     @property
     def is_row(self):
-        return self.value == UpdateAction.UPDATE_ROW.value
+        return self is UpdateAction.UPDATE_ROW
 
     @property
     def is_basket(self):
-        return self.value == UpdateAction.UPDATE_BASKET.value
+        return self is UpdateAction.UPDATE_BASKET
 
     @property
     def is_delete(self):
-        return self.value == UpdateAction.DELETE_ROW.value
+        return self is UpdateAction.DELETE_ROW
 
     @property
     def is_add(self):
-        return self.value == UpdateAction.ADD_ROW.value
+        return self is UpdateAction.ADD_ROW
+
+    @property
+    def is_bulk_add(self):
+        return self is UpdateAction.BULK_ADD
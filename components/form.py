@@ -2,6 +2,8 @@ import dataclasses
 from typing import Optional
 
 from django.forms import Form as DjangoForm
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 
 from .base import AutoTemplateStringComponent
 
@@ -25,6 +27,8 @@ class FormButton(AutoTemplateStringComponent):
     {% endif %}
     '''
 
+    context_from_templates = True
+
 
 @dataclasses.dataclass
 class FormComponent(AutoTemplateStringComponent):
@@ -42,7 +46,7 @@ class FormComponent(AutoTemplateStringComponent):
     show_field_labels:bool = True
 
     template = '''
-    {% load widget_tweaks laces %}
+    {% load laces %}
     <form method="{{ method }}" class="{{ form_class }}" action="{{ action }}" id="#{{ form_id }}">
         {% if form.non_field_errors %}
             <div class="alert alert-danger" role="alert">
@@ -55,30 +59,7 @@ class FormComponent(AutoTemplateStringComponent):
             {% csrf_token %}
         {% endif %}
         <div class="row justify-content-center">
-            {% for field in form %}
-                <div class="mb-md-2 mb-3 {{ field_size }}">
-                    {% if show_field_labels %}
-                        <label for="{{ field.id_for_label }}" class="form-label">{{ field.label }}</label>
-                    {% endif %}
-                    {% if field.field.widget.input_type == 'textarea' %}
-                        <textarea name="{{ field.name }}" id="{{ field.id_for_label }}" class="form-control w-100 {% if field.errors %}is-invalid{% endif %}" rows="3">{{ field.value|default:'' }}</textarea>
-                    {% elif field.field.widget.input_type == 'checkbox' %}
-                    <div class="form-check">
-                        <input type="checkbox" name="{{ field.name }}" id="{{ field.id_for_label }}" class="form-check-input {% if field.errors %}is-invalid{% endif %}" {% if field.value %}checked{% endif %}>
-                    </div>
-                    {% elif field.field.widget.input_type == 'select' %}
-                        {% render_field field class+="form-select w-100" placeholder=field.label %}
-                    {% else %}
-                        {% render_field field class+="form-control w-100" placeholder=field.label %}
-                    {% endif %}
-                    {% if field.errors %}
-                        <div class="invalid-feedback">{{ field.errors.0 }}</div>
-                    {% endif %}
-                    {% if field.help_text %}
-                        <small class="form-text text-muted">{{ field.help_text }}</small>
-                    {% endif %}
-                </div>
-            {% endfor %}
+            {{ fields_html }}
             
             <div class="col col-auto mb-2">
                 <div class="hstack gap-2 justify-content-end d-print-none mt-4 mt-md-0">
@@ -95,4 +76,60 @@ class FormComponent(AutoTemplateStringComponent):
         </div>
         
     </form>
-    '''
\ No newline at end of file
+    '''
+
+    def get_widget_html(self, field):
+        """
+        Render the widget the way ``{% render_field field class+="..." placeholder=field.label %}`` does.
+        """
+        widget = field.field.widget
+        input_type = getattr(widget, 'input_type', None)
+        is_invalid = 'is-invalid' if field.errors else ''
+
+        if input_type == 'textarea':
+            value = field.value()
+            return format_html(
+                '<textarea name="{}" id="{}" class="form-control w-100 {}" rows="3">{}</textarea>',
+                field.html_name, field.id_for_label, is_invalid, value or ''
+            )
+
+        if input_type == 'checkbox':
+            return format_html(
+                '<div class="form-check"><input type="checkbox" name="{}" id="{}" class="form-check-input {}" {}></div>',
+                field.html_name, field.id_for_label, is_invalid, 'checked' if field.value() else ''
+            )
+
+        css_class = 'form-select w-100' if input_type == 'select' else 'form-control w-100'
+        existing_class = widget.attrs.get('class')
+        attrs = {
+            'class': f'{existing_class} {css_class}' if existing_class else css_class,
+            'placeholder': str(field.label),
+        }
+
+        html = field.as_widget(attrs=attrs)
+        if field.field.show_hidden_initial:
+            html += field.as_hidden(only_initial=True)
+        return html
+
+    def get_field_html(self, field):
+        parts = [format_html('<div class="mb-md-2 mb-3 {}">', self.field_size)]
+
+        if self.show_field_labels:
+            parts.append(format_html('<label for="{}" class="form-label">{}</label>', field.id_for_label, field.label))
+
+        parts.append(self.get_widget_html(field))
+
+        if field.errors:
+            parts.append(format_html('<div class="invalid-feedback">{}</div>', field.errors[0]))
+
+        if field.help_text:
+            parts.append(format_html('<small class="form-text text-muted">{}</small>', field.help_text))
+
+        parts.append('</div>')
+        return ''.join(parts)
+
+    def get_context_data(self, parent_context=None):
+        context = super().get_context_data(parent_context)
+        # Fields are rendered in Python; the per-field branching was the bulk of the template's work
+        context['fields_html'] = mark_safe(''.join(self.get_field_html(field) for field in self.form))
+        return context
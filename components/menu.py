@@ -1,9 +1,9 @@
 import dataclasses
+from functools import cached_property
 from typing import List, Optional, Union
 
-from django.urls import reverse
-
-from .base import AutoTemplateStringComponent, TemplateStringComponent
+from .base import AutoTemplateStringComponent, TemplateStringComponent, render_components
+from .utils import cached_reverse, url_cache_key
 
 
 @dataclasses.dataclass
@@ -14,6 +14,8 @@ class MenuSection(AutoTemplateStringComponent):
     <li class="menu-title"><i class="ri-more-fill"></i> <span data-key="t-pages">{{ title }} </span></li>
     '''
 
+    context_from_templates = True
+
 @dataclasses.dataclass
 class MenuItem(AutoTemplateStringComponent):
     label: str
@@ -29,12 +31,16 @@ class MenuItem(AutoTemplateStringComponent):
     </li>
     '''
 
-    def get_menu_id(self):
+    @cached_property
+    def menu_id(self):
         return self.label.lower().replace(' ', '-')
 
+    def get_menu_id(self):
+        return self.menu_id
+
     def get_url(self):
         if self.url_name:
-            return reverse(self.url_name)
+            return cached_reverse(self.url_name)
         else:
             return '#'
 
@@ -66,8 +72,6 @@ class LevelOneMenuItem(MenuItem):
     '''
 
     submenu_template = '''
-    {% load laces %}
-    
     <li class="nav-item{% if active %} active{% endif %}">
         <a class="nav-link menu-link" href="#{{ id }}" data-bs-toggle="collapse" role="button"
            aria-expanded="false" aria-controls="{{ id }}">
@@ -78,9 +82,7 @@ class LevelOneMenuItem(MenuItem):
         </a>
         <div class="collapse menu-dropdown" id="{{ id }}">
             <ul class="nav nav-sm flex-column">
-                {% for menu in submenus %}
-                    {% component menu with ignore=True only %}
-                {% endfor %}
+                {{ submenus_html }}
             </ul>
         </div>
     </li>
@@ -92,6 +94,12 @@ class LevelOneMenuItem(MenuItem):
         else:
             return self.template
 
+    def get_context_data(self, parent_context=None):
+        context = super().get_context_data(parent_context)
+        if self.submenus:
+            context['submenus_html'] = render_components(self.submenus, parent_context)
+        return context
+
 
 
 @dataclasses.dataclass
@@ -110,8 +118,6 @@ class LevelTwoMenuItem(LevelOneMenuItem):
     '''
 
     submenu_template = '''
-    {% load laces %}
-
     <li class="nav-item{% if active %} active{% endif %}">
         <a class="nav-link" href="#{{ id }}" data-bs-toggle="collapse" role="button"
            aria-expanded="false" aria-controls="{{ id }}">
@@ -122,9 +128,7 @@ class LevelTwoMenuItem(LevelOneMenuItem):
         </a>
         <div class="collapse menu-dropdown" id="{{ id }}">
             <ul class="nav nav-sm flex-column">
-                {% for menu in submenus %}
-                    {% component menu with ignore=True only %}
-                {% endfor %}
+                {{ submenus_html }}
             </ul>
         </div>
     </li>
@@ -137,12 +141,33 @@ class Menu(AutoTemplateStringComponent):
     css_class: str = 'menu'
 
     template = '''
-    {% load laces %}
     <nav class="{{ css_class }}">
         <ul class="menu-list">
-            {% for item in items %}
-                {% component item %}
-            {% endfor %}
+            {{ rendered_children }}
         </ul>
     </nav>
-    '''
\ No newline at end of file
+    '''
+
+    @cached_property
+    def _rendered_children(self):
+        return {}
+
+    def get_rendered_children(self, parent_context=None):
+        # Menus are usually static, so the items are rendered once per urlconf, script prefix and language
+        key = url_cache_key()
+        try:
+            return self._rendered_children[key]
+        except KeyError:
+            html = self._rendered_children[key] = render_components(self.items, parent_context)
+            return html
+
+    def invalidate_cache(self):
+        """
+        Drop the rendered items, e.g. after changing which item is active.
+        """
+        self.__dict__.pop('_rendered_children', None)
+
+    def get_context_data(self, parent_context=None):
+        context = super().get_context_data(parent_context)
+        context['rendered_children'] = self.get_rendered_children(parent_context)
+        return context
\ No newline at end of file
@@ -1,6 +1,7 @@
 
+from functools import lru_cache
+
 from django.http import HttpResponse
-from django.urls import reverse
 
 from .base import TemplateStringComponent
 from .form import FormComponent, FormButton
@@ -9,6 +10,21 @@ from .table.table import TableComponent
 from .enums import ViewActionScope
 from .exceptions import CommonException
 from .response import htmx_render
+from .utils import cached_reverse
+
+
+@lru_cache(maxsize=None)
+def _model_columns(model):
+    # Check if model has defined list_display
+    list_display = getattr(model, 'list_display', [])
+    if not list_display:
+        # Dynamically generate list_display from model fields
+        list_display = [
+            BaseColumn(name=field.name, header=field.verbose_name)
+            for field in model._meta.fields
+        ]
+
+    return list_display
 
 
 class ComponentViewMixin:
@@ -48,25 +64,20 @@ class TableComponentViewMixin:
 
     def get_table_columns(self):
         if not self.columns:
-            # Check if model has defined list_display
-            list_display = getattr(self.model, 'list_display', [])
-            if not list_display:
-                # Dynamically generate list_display from model fields
-                list_display = [
-                    BaseColumn(name=field.name, header=field.verbose_name)
-                    for field in self.model._meta.fields
-                ]
-
-            self.columns = list_display
+            # Columns derived from the model are built once per model class
+            self.columns = _model_columns(self.model)
 
         return self.columns
 
+    def get_table_data(self):
+        return self.get_queryset()
+
     def get_table_component(self):
 
         table_class = self.get_table_class()
 
         return table_class(
-            data=self.get_queryset(),
+            data=self.get_table_data(),
             columns=self.get_table_columns(),
             model=self.model,
             editable=self.editable,
@@ -138,8 +149,11 @@ class FormComponentViewMixin:
         return self.form_button or FormButton(text='Save', button_type='submit', classes='btn-lg btn-success mt-3')
 
     def get_cancel_button(self):
-        return self.cancel_button or FormButton(
+        if self.cancel_button:
+            return self.cancel_button
+
+        return FormButton(
             text='Cancel', button_type='link', classes='btn-lg btn-light mt-3 me-5', icon='ri-close-fill',
-            url=reverse(f'{self.model._meta.app_label}:{self.model.url_base_name}-list')
+            url=cached_reverse(f'{self.model._meta.app_label}:{self.model.url_base_name}-list')
         )
 
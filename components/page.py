@@ -1,7 +1,9 @@
 import dataclasses
+from functools import cached_property
 from typing import List, Optional
 
-from .base import AutoTemplateStringComponent, TemplateStringComponent
+from .base import AutoTemplateStringComponent, TemplateStringComponent, render_components
+from .utils import url_cache_key
 from .card import SummaryCardList
 from .form import FormComponent
 
@@ -19,6 +21,8 @@ class Breadcrumb(AutoTemplateStringComponent):
         {% endif %}
     '''
 
+    context_from_templates = True
+
 
 @dataclasses.dataclass
 class Heading(AutoTemplateStringComponent):
@@ -26,16 +30,13 @@ class Heading(AutoTemplateStringComponent):
     breadcrumbs: List[Breadcrumb] = dataclasses.field(default_factory=list)
 
     template = '''
-    {% load laces %}
     <div class="row">
         <div class="col-12">
             <div class="page-title-box d-sm-flex align-items-center justify-content-between bg-galaxy-transparent">
                 <h4 class="mb-sm-0">{{title}}</h4>
                 <div class="page-title-right">
                     <ol class="breadcrumb m-0">
-                        {% for item in breadcrumbs %}
-                            {% component item %}
-                        {% endfor %}
+                        {{ rendered_children }}
                     </ol>
                 </div>
 
@@ -44,6 +45,30 @@ class Heading(AutoTemplateStringComponent):
     </div>
     '''
 
+    @cached_property
+    def _rendered_children(self):
+        return {}
+
+    def get_rendered_children(self, parent_context=None):
+        # Breadcrumbs rarely change after construction, so they are rendered once per urlconf, script prefix and language
+        key = url_cache_key()
+        try:
+            return self._rendered_children[key]
+        except KeyError:
+            html = self._rendered_children[key] = render_components(self.breadcrumbs, parent_context)
+            return html
+
+    def invalidate_cache(self):
+        """
+        Drop the rendered breadcrumbs so the next render picks up changes.
+        """
+        self.__dict__.pop('_rendered_children', None)
+
+    def get_context_data(self, parent_context=None):
+        context = super().get_context_data(parent_context)
+        context['rendered_children'] = self.get_rendered_children(parent_context)
+        return context
+
 @dataclasses.dataclass
 class Page(AutoTemplateStringComponent):
     heading: Heading
@@ -1,17 +1,84 @@
 import dataclasses
 import datetime
+import operator
 import re
-from typing import Optional, List, Any, Dict
+import string
+import time
+from functools import cached_property, lru_cache
+from typing import Optional, List, Any, Dict, Tuple
 
-from django.urls import reverse
+from django.conf import settings
+from django.urls import NoReverseMatch, reverse
 from django.db import models
-from django.utils.html import escape, format_html
+from django.db.models.signals import post_delete, post_save
+from django.utils.html import conditional_escape, escape
 from django.utils.safestring import mark_safe
 from laces.components import Component
 
 from ..enums import ViewActionScope, UpdateAction
 from ..utils import two_d
 
+# Whitespace runs collapsed when minifying cell html
+_WS_RE = re.compile(r'[ \t\n\r]+')
+
+# Html attributes minified along with the ``*template`` attributes
+_MINIFIED_ATTRS = ('td_str', 'hx_attrs')
+
+
+def _minify_templates(cls):
+    """
+    Collapse whitespace in the html string attributes defined on ``cls``, once at class creation
+    instead of on every cell render.
+    """
+    for name, value in list(cls.__dict__.items()):
+        if isinstance(value, str) and (name.endswith('template') or name in _MINIFIED_ATTRS):
+            setattr(cls, name, _WS_RE.sub(' ', value).strip())
+
+
+# Separators shown as spaces in headers derived from column names
+_HEADER_TRANS = str.maketrans('_-', '  ')
+
+def _escape_braces(text):
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def _specialize_template(template, static_data):
+    """
+    Substitute the fields of ``static_data`` into a format string, html escaped, and turn the
+    remaining fields into positional ``%s`` slots for the per-cell render.
+    Returns the template and the fields filling its slots in order.
+    Per-cell fields with a format spec or conversion keep the template a ``str.format`` string,
+    returned with ``None`` instead of the fields.
+    """
+    parsed = list(string.Formatter().parse(template))
+
+    def is_static(field, format_spec, conversion):
+        return field in static_data and not format_spec and not conversion
+
+    use_format = any(
+        field is not None and (format_spec or conversion) and not is_static(field, format_spec, conversion)
+        for _, field, format_spec, conversion in parsed
+    )
+
+    parts = []
+    fields = []
+    for literal, field, format_spec, conversion in parsed:
+        parts.append(_escape_braces(literal) if use_format else literal.replace('%', '%%'))
+        if field is None:
+            continue
+        if is_static(field, format_spec, conversion):
+            value = str(conditional_escape(static_data[field]))
+            parts.append(_escape_braces(value) if use_format else value.replace('%', '%%'))
+        elif use_format:
+            conversion = f'!{conversion}' if conversion else ''
+            format_spec = f':{format_spec}' if format_spec else ''
+            parts.append(f'{{{field}{conversion}{format_spec}}}')
+        else:
+            parts.append('%s')
+            fields.append(field)
+
+    return ''.join(parts), None if use_format else tuple(fields)
+
 
 @dataclasses.dataclass(frozen=False)
 class BaseColumn(Component):
@@ -23,6 +90,9 @@ class BaseColumn(Component):
     align: str = "left"
     styles: str = ""
     classes: str = ""
+    # Relations the column reads, loaded with the table's queryset
+    select_related: Tuple[str, ...] = ()
+    prefetch_related: Tuple[str, ...] = ()
     field_name = None
 
     template = '''<span>{value}</span>'''
@@ -31,16 +101,32 @@ class BaseColumn(Component):
 
     pk_field = "pk"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _minify_templates(cls)
+
     def __post_init__(self):
-        self.header = self.header or self.name.replace('_', ' ').replace('-', ' ').title()
+        self.header = self.header or self.name.translate(_HEADER_TRANS).title()
         self.key = self.key or self.name
         self.field_name = self.name
+        self._keys = tuple(self.key.split('.'))
+        self._value_getter = operator.attrgetter(self.key)
+        self._specialized_templates = {}
+        self._static_template_keys = {}
 
     def get_value(self, row):
-        keys = self.key.split('.')
+        if not isinstance(row, dict):
+            # Attribute-only paths resolve in C; anything unusual takes the lookup loop below
+            try:
+                value = self._value_getter(row)
+            except (AttributeError, TypeError):
+                pass
+            else:
+                return "" if value is None else value
+
         value = row
 
-        for key in keys:
+        for key in self._keys:
             if hasattr(value, key):
                 value = getattr(value, key)
             elif isinstance(value, dict):
@@ -53,14 +139,18 @@ class BaseColumn(Component):
 
         return value
 
+    def get_value_fields(self):
+        """
+        Model fields the column reads from a row, for tables rendering ``values()`` rows.
+        None when the column needs model instances.
+        """
+        return None if '.' in self.key else (self.key,)
+
     def get_id(self, row):
         if hasattr(row, self.pk_field):
             return getattr(row, self.pk_field)
         return row.get("id") if isinstance(row, dict) else None
 
-    def get_row(self, context=None):
-        return context.get("row") if context else None
-
     def render(self, row):
         return self.get_value(row)
 
@@ -71,31 +161,82 @@ class BaseColumn(Component):
         return self.classes
 
     def get_template(self, value):
-        return self.template if self.editable else value
+        return self.template if self.editable else '{value}'
 
-    def get_template_data(self, value, row_id, row, extra_context=None):
+    def get_static_template_data(self, render_mode='full'):
+        """
+        Template values that are the same for every row of the column, included in get_template_data.
+        Their values are baked into a copy of the template, reused while they stay the same.
+        """
         return {
-            "value": value,
             "class": self.get_classes(),
             "style": self.get_styles(),
             'align':self.align
         }
 
+    def get_template_data(self, value, row_id, row, extra_context=None):
+        render_mode = extra_context.get("render_mode", 'full') if extra_context else 'full'
+        data = self.get_static_template_data(render_mode)
+        data["value"] = value
+        return data
+
+    def get_static_template_keys(self, render_mode='full'):
+        """Names of the get_static_template_data() values, looked up once per render mode."""
+        try:
+            return self._static_template_keys[render_mode]
+        except KeyError:
+            keys = self._static_template_keys[render_mode] = tuple(self.get_static_template_data(render_mode))
+            return keys
+
+    def get_specialized_template(self, template, render_mode='full', static_data=()):
+        """
+        The cell template with ``static_data``, a tuple of ``(key, value)`` pairs, substituted in.
+        Returns the template and the fields left to fill per row, as ``_specialize_template`` does.
+        """
+        key = (render_mode, template, static_data)
+        try:
+            return self._specialized_templates[key]
+        except KeyError:
+            column_string = self.td_str % template if render_mode == 'full' else template
+            specialized = _specialize_template(column_string, dict(static_data))
+            # Values that vary per row would grow the cache without bound
+            if len(self._specialized_templates) >= 64:
+                self._specialized_templates.clear()
+            self._specialized_templates[key] = specialized
+            return specialized
+
     def render_html(self, parent_context=None):
-        row  = self.get_row(parent_context)
+        row = parent_context.get("row") if parent_context else None
         value = self.get_value(row)
         template_data = self.get_template_data(
             value, self.get_id(row), row, parent_context
         )
         # Render mode determines whether column is rendered with td element or only input.
-        #  Options are either 'full' or 'partial'
+        #  Options are either 'full' or 'partial'. Anything mode specific is baked into its own template.
         render_mode = parent_context.get("render_mode", 'full') if parent_context else 'full'
 
-        column_string = self.td_str % self.get_template(value) if render_mode == 'full' else self.get_template(value)
+        # The static values as this row has them, so overrides in get_template_data win
+        static_data = tuple(
+            (key, template_data[key]) for key in self.get_static_template_keys(render_mode) if key in template_data
+        )
+
+        # Templates are minified when the column class is created
+        try:
+            template, fields = self.get_specialized_template(self.get_template(value), render_mode, static_data)
+        except TypeError:
+            # Unhashable values can't key the cache; fill every field per row
+            template, fields = self.get_specialized_template(self.get_template(value), render_mode)
+
+        # Every per-row value is escaped, as format_html would; safe html such as options passes through
+        if fields is None:
+            return mark_safe(template.format_map(
+                {key: conditional_escape(value) for key, value in template_data.items()}
+            ))
 
-        html_minified = re.sub(r'\s+', ' ', column_string).strip()
+        return mark_safe(template % tuple(conditional_escape(template_data[field]) for field in fields))
 
-        return format_html(html_minified, **template_data)
+
+_minify_templates(BaseColumn)
 
 
 @dataclasses.dataclass
@@ -106,18 +247,31 @@ class LinkColumn(BaseColumn):
     template = '''<span><a href="{url}" hx-get="{url}" class="">{value}</a></span>'''
     url_args: List[str] = dataclasses.field(default_factory=list)
 
+    def __post_init__(self):
+        super().__post_init__()
+        # Detail links take the row's pk first; a new list keeps the caller's list untouched
+        if self.detail:
+            self.url_args = ['pk'] + self.url_args
+
+    def get_value_fields(self):
+        # Urls come from model methods and attribute paths on the row
+        return None
+
+    @cached_property
+    def url_arg_getters(self):
+        return tuple(operator.attrgetter(arg) for arg in self.url_args)
+
     def get_url(self, row):
         try:
             if hasattr(row, 'get_detail_url'):
                 return row.get_detail_url()
             if self.url_name:
-                if self.detail:
-                    self.url_args = ['pk'] + self.url_args
-                args = [getattr(row, arg) for arg in self.url_args]
-                return reverse(self.url_name, args=args)
-            return "#"
-        except:
-            return "#"
+                return reverse(self.url_name, args=[getter(row) for getter in self.url_arg_getters])
+        except (AttributeError, KeyError, ValueError, NoReverseMatch):
+            # Rows missing a url argument, or args the url pattern rejects, get no link
+            pass
+
+        return "#"
 
     def get_template_data(self, value, row_id, row, extra_context=None):
         url = self.get_url(row)
@@ -145,25 +299,39 @@ class HTMLInputColumn(BaseColumn):
     def get_input_type(self):
         return self.input_type
 
+    @cached_property
+    def attrs_html(self):
+        return mark_safe(" ".join([f'{key}={value}' for key, value in self.attrs.items()]))
+
     def get_template(self, value):
         return self.template if self.editable else '<span>{value}</span>'
 
+    @cached_property
+    def input_name_format(self):
+        return 'row-%s-' + self.field_name.replace('%', '%%')
+
     def get_input_name(self, row_id):
-        return f'row-{row_id}-{self.field_name}'
+        return self.input_name_format % (row_id,)
 
     def get_value_from_data(self, row_id, data):
         return data.get(self.get_input_name(row_id))
 
-    def get_template_data(self, value, row_id, row, extra_context=None):
-        data = super().get_template_data(value, row_id, row)
-        input_name = self.get_input_name(row_id)
+    def get_static_template_data(self, render_mode='full'):
+        data = super().get_static_template_data(render_mode)
         data.update({
             "input_type": self.get_input_type(),
-            "name": input_name,
-            "id": f'id_{input_name}',
             "input_class": self.input_class,
             'input_style': self.input_style,
-            'attrs': mark_safe(" ".join([f'{key}={value}' for key, value in self.attrs.items()])),
+            'attrs': self.attrs_html,
+        })
+        return data
+
+    def get_template_data(self, value, row_id, row, extra_context=None):
+        data = super().get_template_data(value, row_id, row, extra_context)
+        input_name = self.get_input_name(row_id)
+        data.update({
+            "name": input_name,
+            "id": 'id_' + input_name,
         })
 
         return data
@@ -197,36 +365,55 @@ class TextColumn(HTMLInputColumn):
     def get_hx_target(self):
         return 'closest td' if self.action.is_cell else 'closest tr'
 
+    @cached_property
+    def htmx_target(self):
+        # The 'hx_target' name is taken by the dataclass field
+        return self.get_hx_target()
+
     def get_htmx_attributes(self):
         return self.hx_attrs.format(
             post=self.hx_post,
-            target=self.get_hx_target(),
+            target=self.htmx_target,
             trigger=self.hx_trigger,
             indicator=self.hx_indicator,
             swap=self.hx_swap
         )
 
+    @cached_property
+    def htmx_attributes(self):
+        # Only depends on the column's own settings, so it is formatted once per column
+        return mark_safe(self.get_htmx_attributes())
+
     def get_submit(self):
         return 'cell' if self.action.is_cell else 'row'
 
-    def get_template_data(self, value, row_id, row, extra_context=None):
-
-        # Check render mode from parent context
-        render_mode = extra_context.get("render_mode", 'full') if extra_context else 'full'
-        # Add out of band swap attribute to attributes if render mode is partial
-        if render_mode == 'partial':
-            self.attrs['hx-swap-oob'] = '"true"'
+    @cached_property
+    def submit_target(self):
+        return self.get_submit()
 
+    def get_template_data(self, value, row_id, row, extra_context=None):
         data  = super().get_template_data(value, row_id, row, extra_context=extra_context)
 
         data.update({
             "row_id": row_id,
+        })
+
+        return data
+
+    def get_static_template_data(self, render_mode='full'):
+        data = super().get_static_template_data(render_mode)
+        data.update({
             "field": self.field_name,
-            "htmx": mark_safe(self.get_htmx_attributes()),
-            'submit':self.get_submit(),
+            "htmx": self.htmx_attributes,
+            'submit':self.submit_target,
             'action':self.action.value,
             'scope': self.scope.value,
         })
+
+        # Add out of band swap attribute to attributes if render mode is partial
+        if render_mode == 'partial':
+            data['attrs'] = mark_safe(f'{data["attrs"]} hx-swap-oob="true"')
+
         return data
 
 
@@ -279,28 +466,33 @@ class QuantityColumn(TextColumn):
     def get_button_htmx_attrs(self):
         return self.hx_attrs.format(
             post=self.hx_post,
-            target=self.get_hx_target(),
+            target=self.htmx_target,
             trigger='click',
             indicator=self.hx_indicator,
             swap=self.hx_swap
         )
 
+    @cached_property
+    def button_htmx_attributes(self):
+        return mark_safe(self.get_button_htmx_attrs())
+
     def get_template(self, value):
         if not self.editable:
             return super().get_template(value)
 
-        return f'''
-            <div class="input-group flex-nowrap" >
-            {self.reduce_button_template}
-            {super().get_template(value)}
-            {self.increase_button_template}
-            </div>
-        '''
+        return (
+            '<div class="input-group flex-nowrap">'
+            f'{self.reduce_button_template} {super().get_template(value)} {self.increase_button_template}'
+            '</div>'
+        )
 
     def get_template_data(self, value, row_id, row, extra_context=None):
-        data = super().get_template_data(value, row_id, row)
+        return super().get_template_data(value, row_id, row, extra_context)
+
+    def get_static_template_data(self, render_mode='full'):
+        data = super().get_static_template_data(render_mode)
         data.update({
-            "button_htmx": mark_safe(self.get_button_htmx_attrs())
+            "button_htmx": self.button_htmx_attributes
         })
         return data
 
@@ -314,6 +506,48 @@ class DateColumn(TextColumn):
         return escape(date_value.strftime("%Y-%m-%d")) if date_value else ""
 
 
+@lru_cache(maxsize=64)
+def _enabled_options(model, period):
+    # ``period`` only keys the cache, so entries expire when it moves on
+    return tuple((item.id, str(item)) for item in model.objects.enabled())
+
+
+def _enabled_options_for(model):
+    """
+    ``(id, label)`` pairs of the enabled instances of ``model``, queried once per model instead of
+    once per row. Kept for ``LACES_OPTIONS_CACHE_TIMEOUT`` seconds (30 by default, 0 to query every
+    time), so changes made by other processes or by bulk queries show up within that time.
+    Cleared at once when such a model is saved or deleted in this process.
+    """
+    timeout = getattr(settings, 'LACES_OPTIONS_CACHE_TIMEOUT', 30)
+    if not timeout:
+        return _enabled_options.__wrapped__(model, None)
+    return _enabled_options(model, int(time.monotonic() // timeout))
+
+
+def _option_parts(options):
+    """
+    Pre-render ``<option>`` tags around the point where ``selected`` goes,
+    so rendering a select only has to compare ids.
+    """
+    return tuple(
+        (value_id, f'<option value="{escape(value_id)}" ', f'>{escape(label)}</option>')
+        for value_id, label in options
+    )
+
+
+_cached_option_parts = lru_cache(maxsize=64)(_option_parts)
+
+
+def _clear_enabled_options(sender, **kwargs):
+    if hasattr(sender._default_manager, 'enabled'):
+        _enabled_options.cache_clear()
+
+
+post_save.connect(_clear_enabled_options, dispatch_uid='components.table.columns.enabled_options')
+post_delete.connect(_clear_enabled_options, dispatch_uid='components.table.columns.enabled_options')
+
+
 @dataclasses.dataclass(frozen=False)
 class SelectColumn(TextColumn):
 
@@ -336,22 +570,31 @@ class SelectColumn(TextColumn):
         if not value:
             return []
         # Check if value is an instance of a model
-        return [
-            (item.id, item.__str__()) for item in value.__class__.objects.enabled()
-        ] if isinstance(value, models.Model) else []
+        return _enabled_options_for(value.__class__) if isinstance(value, models.Model) else []
 
-    def get_options(self, value, row):
-        options_templ = []
+    @cached_property
+    def option_parts(self):
+        return _option_parts(self.options or ())
+
+    def get_option_parts(self, value, row):
         options = self.get_value_options(value, row)
-        for value_id, label in options:
-            selected = "selected" if value_id == value.id else ""
-            options_templ.append(f'<option value="{value_id}" {selected}>{label}</option>')
-        if options_templ:
-            return mark_safe("\n".join(options_templ))
-        return ""
+        if options is self.options:
+            return self.option_parts
+        if isinstance(options, tuple):
+            return _cached_option_parts(options)
+        return _option_parts(options)
+
+    def get_options(self, value, row):
+        parts = self.get_option_parts(value, row)
+        if not parts:
+            return ""
+        current = getattr(value, 'id', value)
+        return mark_safe("\n".join(
+            head + ("selected" if value_id == current else "") + tail for value_id, head, tail in parts
+        ))
 
     def get_template_data(self, value, row_id, row, extra_context=None):
-        data = super().get_template_data(value, row_id, row)
+        data = super().get_template_data(value, row_id, row, extra_context)
         data.update({
             "options": mark_safe(self.get_options(value, row))
         })
@@ -388,18 +631,24 @@ class ButtonColumn(HTMLInputColumn):
         return self.template
 
     def get_template_data(self, value, row_id, row, extra_context=None):
-        data = super().get_template_data(value, row_id, row)
+        data = super().get_template_data(value, row_id, row, extra_context)
         data.update({
             "row_id": row_id,
-            "btn_class": self.btn_class,
-            "label": self.label,
             "url": self.get_url(row_id, row),
             # 'hx_vals':'js:{...getRowData(this)}'
-            'scope': self.scope.value,
         })
 
         return data
 
+    def get_static_template_data(self, render_mode='full'):
+        data = super().get_static_template_data(render_mode)
+        data.update({
+            "btn_class": self.btn_class,
+            "label": self.label,
+            'scope': self.scope.value,
+        })
+        return data
+
 
 class LinkButtonColumn(ButtonColumn):
     template = '''
@@ -452,8 +701,8 @@ class ModalLinkButtonColumn(ButtonColumn):
             </a>
         '''
 
-    def get_template_data(self, value, row_id, row, extra_context=None):
-        data = super().get_template_data(value, row_id, row)
+    def get_static_template_data(self, render_mode='full'):
+        data = super().get_static_template_data(render_mode)
         data.update({
             "onclick": self.onclick,
         })
@@ -1,8 +1,16 @@
 import dataclasses
+import json
+from functools import cached_property
+from itertools import chain
 from typing import Optional, Any, List, Dict
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import QuerySet, Model
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
 
 from ..enums import UpdateAction
 from ..exceptions import CommonException
@@ -10,6 +18,18 @@ from ..base import TemplateStringComponent
 from .columns import DeleteButtonColumn, AddRowButtonColumn, BaseColumn
 
 
+def _default_bulk_batch_size():
+    return getattr(settings, 'LACES_BULK_BATCH_SIZE', 100)
+
+
+class _RowEncoder(DjangoJSONEncoder):
+    # Cell values the encoder does not know (e.g. related objects) are sent as their text
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
 
 @dataclasses.dataclass(frozen=False)
 class TableComponent(TemplateStringComponent):
@@ -25,6 +45,15 @@ class TableComponent(TemplateStringComponent):
 
     page_size: int = 25
 
+    # Rows per query for bulk row creation and updates
+    bulk_batch_size: int = dataclasses.field(default_factory=_default_bulk_batch_size)
+
+    # 'json' renders the current page as row data for client side templates instead of html
+    render_format: str = 'html'
+
+    # Render rows from a values() projection of the fields the columns read, instead of model instances
+    values_only: bool = False
+
     template:str = '''
         {% load laces i18n %}
 
@@ -181,13 +210,39 @@ class TableComponent(TemplateStringComponent):
     #     {% endif %}
     # '''
 
-    def get_model(self):
+    # Method handling each update action, looked up by name so subclasses can override it
+    action_handlers = {
+        UpdateAction.DELETE_ROW: '_delete_action',
+        UpdateAction.UPDATE_CELL: '_cell_action',
+        UpdateAction.UPDATE_ROW: '_row_action',
+        UpdateAction.ADD_ROW: '_add_action',
+        UpdateAction.BULK_ADD: '_bulk_add_action',
+        UpdateAction.UPDATE_BASKET: '_basket_action',
+    }
+
+    # Fragment combinations the table renders itself, assembled up front
+    preset_fragments = ('', 'row', 'row,total', 'total', 'rows')
+
+    def __post_init__(self):
+        self.template_sources = {fragments: self.build_template(fragments) for fragments in self.preset_fragments}
+        # Querysets get relation loading and values() projection when paginated; other data is used as is
+        self._is_queryset = isinstance(self.data, QuerySet)
+        self._model = self.resolve_model()
+        self._columns = tuple(self.columns or ())
+        # Row action columns of editable tables, shared by every render
+        self._delete_column = self.get_delete_column() if self.editable else None
+        self._add_column = self.get_add_column() if self.editable else None
+
+    def resolve_model(self):
         if self.model:
             return self.model
-        elif isinstance(self.data, QuerySet):
+        elif self._is_queryset:
             return self.data.model
         return None
 
+    def get_model(self):
+        return self._model
+
     def paginate(self, paginator_class=Paginator, per_page=None, page=1, *args, **kwargs):
         """
         Paginates the table using a paginator and creates a ``page`` property
@@ -208,46 +263,193 @@ class TableComponent(TemplateStringComponent):
         """
 
         per_page = per_page or self.page_size
-        self.paginator = paginator_class(self.data, per_page, *args, **kwargs)
+        data = self.get_queryset_with_relations()
+        if self.values_only and self._is_queryset:
+            fields = self.get_values_fields()
+            if fields is not None:
+                data = data.values(*fields)
+
+        self.paginator = paginator_class(data, per_page, *args, **kwargs)
         self.page = self.paginator.page(page)
 
         return self
 
+    def get_queryset_with_relations(self):
+        """
+        Apply the ``select_related`` and ``prefetch_related`` lookups declared by the columns,
+        so that cells reading related objects do not query once per row.
+        """
+        if not self._is_queryset:
+            return self.data
+
+        columns = self.get_columns()
+        data = self.data
+        select_related = tuple(chain.from_iterable(column.select_related for column in columns))
+        if select_related:
+            data = data.select_related(*select_related)
+        prefetch_related = tuple(chain.from_iterable(column.prefetch_related for column in columns))
+        if prefetch_related:
+            data = data.prefetch_related(*prefetch_related)
+
+        return data
+
+    def prepaginate(self, request):
+        """
+        Paginate ahead of rendering, for callers that need the paginator (e.g. its count) first.
+        The next render uses this page instead of paginating again.
+        """
+        self.paginate(page=self.get_page(request))
+        self.paginated = True
+        return self.paginator
+
+    def get_values_fields(self):
+        """
+        Fields to project for ``values_only`` tables, or None when a column reads something
+        ``values()`` cannot provide (a relation, a property or a method).
+        """
+        model = self.get_model()
+        if model is None:
+            return None
+
+        concrete_fields = {field.attname for field in model._meta.concrete_fields}
+        fields = dict.fromkeys(('pk', model._meta.pk.attname))
+        for column in self.get_columns():
+            column_fields = column.get_value_fields()
+            if column_fields is None or not concrete_fields.issuperset(column_fields):
+                return None
+            fields.update(dict.fromkeys(column_fields))
+
+        return tuple(fields)
+
+    def get_render_page(self, request):
+        # Only the render right after prepaginate() reuses its page
+        if not self.__dict__.pop('paginated', False):
+            self.paginate(page=self.get_page(request))
+        return self.page
+
     def get_page(self, request):
         return request.GET.get('page', 1)
 
     def get_columns(self):
-        if not self.columns:
+        if not self._columns:
             raise ValueError("Columns are required")
 
-        base_columns = self.columns
-
-        return base_columns
+        return self._columns
 
     def get_context_data(self, parent_context=None):
-        request = parent_context.get('request')
-        self.paginate(page=self.get_page(request))
-
-        delete_column = None
-        add_column = None
-        if self.editable:
-            delete_column = DeleteButtonColumn(key='id', editable=False, sortable=False)
-            add_column = AddRowButtonColumn(key='id', editable=False, sortable=False)
+        self.get_render_page(parent_context.get('request'))
 
         return {
             "columns": self.get_columns(),
-            "rows": self.data,
+            "rows": self.page.object_list,
             "editable": self.editable,
             "class_names": self.class_names,
             "numbered": self.numbered,
-            "delete_column": delete_column,
-            "add_column": add_column,
+            "delete_column": self._delete_column,
+            "add_column": self._add_column,
             "page": self.page,
             "paginator": self.paginator,
             "page_field": self.page_field,
+            # Row being rendered by the row fragment after an update
+            "row": parent_context.get('row'),
+            "updated": parent_context.get('updated', False),
         }
 
+    def render_html(self, parent_context=None):
+        if self.render_format == 'json':
+            return self.render_json(parent_context)
+        return super().render_html(parent_context)
+
+    def render_json(self, parent_context=None):
+        """
+        Current page as JSON: the column names and, for each row, its id and column values.
+        """
+        page = self.get_render_page(parent_context.get('request'))
+        columns = self.get_columns()
+
+        return json.dumps({
+            'columns': [column.name for column in columns],
+            'rows': [
+                {'id': columns[0].get_id(row), **{column.name: column.get_value(row) for column in columns}}
+                for row in page.object_list
+            ],
+            'page': page.number,
+            'num_pages': self.paginator.num_pages,
+        }, cls=_RowEncoder)
+
+    def get_delete_column(self):
+        return DeleteButtonColumn(name='delete', key='id', editable=False, sortable=False)
+
+    def get_add_column(self):
+        return AddRowButtonColumn(name='add', key='id', editable=False, sortable=False)
+
+    @cached_property
+    def row_renderer(self):
+        """
+        Python equivalent of the default ``row_template``, specialized for this table's ``numbered``
+        and ``editable`` settings, so row updates skip the template engine.
+        None when the row template has been customized.
+        """
+        if self.row_template != TableComponent.row_template:
+            return None
+
+        cells = self.get_columns()
+        if self._delete_column is not None:
+            # A new tuple, so a get_columns() returning a list it keeps is left untouched
+            cells = (*cells, self._delete_column)
+
+        row_start = '<tr id="row-%s" class="{}"%s >'.format(
+            'hover-actions-trigger btn-reveal-trigger position-static' if self.editable else ''
+        )
+        # Row fragments are rendered without a counter
+        number_cell = '<td><h6 class="align-middle row-number"></h6></td>' if self.numbered else ''
+
+        def render_row(row, request=None, updated=False):
+            context = {'request': request, 'row': row}
+            row_id = row.get('id', '') if isinstance(row, dict) else getattr(row, 'id', '')
+            html = [
+                row_start % (conditional_escape(row_id), ' hx-swap-oob="true"' if updated else ''),
+                number_cell,
+            ]
+            html.extend(cell.render_html(context) for cell in cells)
+            html.append('</tr>')
+            return mark_safe(''.join(html))
+
+        return render_row
+
+    def render_row(self, request, row, updated=False):
+        if self.row_renderer is not None:
+            return self.row_renderer(row, request, updated)
+
+        return self.render_html(
+            parent_context={
+                'request': request,
+                'fragments': 'row',
+                'row': row,
+                'updated': updated
+            }
+        )
+
+    def render_total(self, request):
+        if not self.total_template:
+            return mark_safe('')
+
+        return self.render_html(
+            parent_context={
+                'request': request,
+                'fragments': 'total'
+            }
+        )
+
     def get_template(self, fragments=''):
+        # Returning the same string object each time also keeps its hash for the compiled template cache
+        try:
+            return self.template_sources[fragments]
+        except KeyError:
+            source = self.template_sources[fragments] = self.build_template(fragments)
+            return source
+
+    def build_template(self, fragments=''):
 
         templates = {
             '':self.template,
@@ -268,25 +470,53 @@ class TableComponent(TemplateStringComponent):
     def add_row(self, data, **kwargs):
         return self.model.objects.create(**data)
 
+    def add_rows(self, data_list, batch_size=None, **kwargs):
+        return self.model.objects.bulk_create(
+            [self.model(**data) for data in data_list], batch_size=batch_size or self.bulk_batch_size
+        )
+
+    def get_bulk_add_fields(self):
+        """Fields the bulk-add action may set on new rows: the keys of the editable columns."""
+        return frozenset(column.key for column in self.get_columns() if column.editable and '.' not in column.key)
+
     def delete_row(self, row_id):
         self.model.objects.filter(**{self.pk_field:row_id}).delete()
         return ''
 
-    def update_field(self, *, row_id, field, value, column, data=None, **kwargs):
-        obj = self.get_row(row_id)
+    def update_field(self, *, row_id, field, value, column, data=None, obj=None, **kwargs):
+        obj = obj or self.get_row(row_id)
         obj.update(**{field: value})
         return obj
 
 
-    def update_row(self, *, row_id, data, **kwargs):
-        obj = self.get_row(row_id)
+    def update_row(self, *, row_id, data, obj=None, **kwargs):
+        obj = obj or self.get_row(row_id)
         obj.update(**data)
         return obj
 
+    def update_rows(self, data_list, batch_size=None, **kwargs):
+        """
+        Update many rows with one query per batch. Each item of ``data_list`` holds the row's
+        ``pk_field`` value along with the fields to set.
+        """
+        rows = {str(data[self.pk_field]): data for data in data_list}
+        objs = list(self.model.objects.filter(**{f'{self.pk_field}__in': list(rows)}))
+
+        fields = set()
+        for obj in objs:
+            for field, value in rows[str(getattr(obj, self.pk_field))].items():
+                if field != self.pk_field:
+                    setattr(obj, field, value)
+                    fields.add(field)
+
+        if fields:
+            self.model.objects.bulk_update(objs, fields, batch_size=batch_size or self.bulk_batch_size)
+        return objs
+
     def get_column(self, name):
-        return filter(lambda c: c.name == name, self.columns)
+        return next((column for column in self.columns if column.name == name), None)
 
-    def _delete_action(self, request, row_id):
+    def _delete_action(self, request, row_id, field=None, **kwargs):
 
         fragments = 'total' if self.total_template else ''
 
@@ -316,13 +546,18 @@ class TableComponent(TemplateStringComponent):
 
         # Get column by field name
         column = self.get_column(field)
+        if column is None:
+            raise ValueError(f"Column {field} not found")
+
+        # Fetched once for the update; a failed update may have changed it, so errors render a fresh row
+        obj = self.get_row(row_id)
 
         try:
             value = column.get_value_from_data(row_id, request.POST)
 
             obj = self.update_field(
                 row_id=row_id, field=column.key, value=value,
-                column=column, data=request.POST, **kwargs
+                column=column, data=request.POST, obj=obj, **kwargs
             )
 
             return column.render_html(
@@ -342,51 +577,47 @@ class TableComponent(TemplateStringComponent):
                 }
             ), ex.__str__()
 
-    def _row_action(self, request, row_id, **kwargs):
-        fragments = 'row,total' if self.total_template else 'row'
+    def _row_action(self, request, row_id, field=None, **kwargs):
+        obj = self.get_row(row_id)
 
         try:
             obj = self.update_row(
-                row_id=row_id, data=request.POST,
+                row_id=row_id, data=request.POST, obj=obj,
                 **kwargs
             )
 
-            return self.render_html(
-                parent_context={
-                    'request': request,
-                    'fragments': fragments,
-                    'row': obj,
-                    'updated': True
-                }
-            ), None
+            return self.render_row(request, obj, updated=True) + self.render_total(request), None
         except (ValueError, CommonException) as ex:
-            return self.render_html(
-                parent_context={
-                    'request': request,
-                    'fragments': fragments,
-                    'row': self.get_row(row_id),
-                    'updated': True
-                }
-            ), ex.__str__()
-
-    def _add_action(self, request, **kwargs):
-        fragments = 'row,total' if self.total_template else 'row'
+            # The row as stored, not as the failed update left it
+            return self.render_row(request, self.get_row(row_id), updated=True) + self.render_total(request), ex.__str__()
 
+    def _add_action(self, request, row_id=None, field=None, **kwargs):
         try:
             obj, created = self.add_row(data=request.POST, **kwargs)
 
-            return self.render_html(
-                parent_context={
-                    'request': request,
-                    'fragments': fragments,
-                    'row': obj,
-                    'updated': not created
-                }
-            ), None
+            return self.render_row(request, obj, updated=not created) + self.render_total(request), None
         except (ValueError, CommonException) as ex:
             return "", ex.__str__()
 
-    def _basket_action(self, request, table, **kwargs):
+    def _bulk_add_action(self, request, row_id=None, field=None, **kwargs):
+        try:
+            data_list = json.loads(request.POST.get('rows', '[]'))
+            if not isinstance(data_list, list) or not all(isinstance(data, dict) for data in data_list):
+                raise ValueError("Rows must be a list of objects")
+
+            # Client rows only set the fields shown as editable columns
+            fields = self.get_bulk_add_fields()
+            data_list = [{key: value for key, value in data.items() if key in fields} for data in data_list]
+
+            objs = self.add_rows(data_list, **kwargs)
+
+            html = ''.join(self.render_row(request, obj) for obj in objs)
+
+            return mark_safe(html) + self.render_total(request), None
+        except (ValueError, TypeError, ValidationError, CommonException) as ex:
+            return "", ex.__str__()
+
+    def _basket_action(self, request, table, row_id=None, field=None, **kwargs):
         fragment = request.POST.get('fragment', '')
 
         try:
@@ -415,15 +646,8 @@ class TableComponent(TemplateStringComponent):
         row_id = request.POST.get('id', '')
         field = request.POST.get('field', '')
 
-        if action.is_delete:
-            return self._delete_action(request=request, row_id=row_id)
-        elif action.is_cell:
-            return self._cell_action(request=request, row_id=row_id, field=field, **kwargs)
-        elif action.is_row:
-            return self._row_action(request=request,row_id=row_id, **kwargs)
-        elif action.is_add:
-            return self._add_action(request=request, **kwargs)
-        elif action.is_basket:
-            return self._basket_action(request=request, **kwargs)
-        else:
+        handler = self.action_handlers.get(action)
+        if handler is None:
             raise ValueError(f"Action {action} not found")
+
+        return getattr(self, handler)(request=request, row_id=row_id, field=field, **kwargs)
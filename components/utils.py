@@ -1,5 +1,28 @@
 from decimal import Decimal as D
+from functools import lru_cache
+
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils.translation import get_language
 
 def two_d(value):
     ret_val = "{:,.2f}".format(D(value))
-    return ret_val
\ No newline at end of file
+    return ret_val
+
+
+@lru_cache(maxsize=512)
+def _reverse_for(url_name, urlconf, script_prefix, language):
+    # script_prefix and language only key the cache; reverse() reads the active ones itself
+    return reverse(url_name, urlconf=urlconf)
+
+
+def url_cache_key():
+    """
+    The urlconf, script prefix and language reverse() depends on, for caching urls and html
+    holding them so i18n_patterns, SCRIPT_NAME and per-request urlconfs each get their own.
+    """
+    return get_urlconf(), get_script_prefix(), get_language()
+
+
+def cached_reverse(url_name):
+    """reverse() for url names without arguments, cached per url_cache_key()."""
+    return _reverse_for(url_name, *url_cache_key())
@@ -75,7 +75,7 @@ class BaseListPage(PageView, TableComponentViewMixin, FormComponentViewMixin):
         cards = [
             SummaryCard(
                 title='Total',
-                value=self.get_queryset().count()
+                value=self.get_total_count()
             )
         ]
 
@@ -91,12 +91,31 @@ class BaseListPage(PageView, TableComponentViewMixin, FormComponentViewMixin):
             cards=cards
         )
 
+    def get_total_count(self):
+        # The table's paginator has already counted the rows when the body builds the table first
+        paginator = getattr(self, 'table_paginator', None)
+        if paginator is not None:
+            return paginator.count
+
+        if not hasattr(self, '_queryset_count'):
+            self._queryset_count = self.get_cached_queryset().count()
+        return self._queryset_count
+
+    def get_cached_queryset(self):
+        # Built once per request and shared by the summary, the table data and the table
+        if not hasattr(self, '_queryset'):
+            self._queryset = self.get_queryset()
+        return self._queryset
+
+    def get_table_data(self):
+        return self.get_cached_queryset()
+
     def get_page_table_data(self):
         if self.request.method == 'POST':
             return []
 
         if not hasattr(self, 'object_list'):
-            self.object_list = self.get_queryset()
+            self.object_list = self.get_cached_queryset()
 
         return self.object_list
 
@@ -107,10 +126,13 @@ class BaseListPage(PageView, TableComponentViewMixin, FormComponentViewMixin):
         return self.get_list_page_body()
 
     def get_list_page_body(self) -> ListPageBody:
+        table = self.get_table_component()
+        self.table_paginator = table.prepaginate(self.request)
+
         return ListPageBody(
             title=self.get_page_sub_title(),
             create_url=reverse(f'{self.model._meta.app_label}:{self.model._meta.model_name}-create'),
-            table=self.get_table_component(),
+            table=table,
             summary=self.get_page_summary(),
             filter_form=self.get_filter_form()
         )
@@ -1,20 +1,134 @@
-from functools import cached_property
+from functools import cached_property, lru_cache
+from itertools import chain
+from operator import attrgetter
 from typing import Any
+import re
 
+import django
 from django.views import View
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect
-from django.views.decorators.csrf import csrf_exempt
-from django.utils.decorators import method_decorator
-from django.core.exceptions import ObjectDoesNotExist
-from django.forms.models import model_to_dict, modelform_factory
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.forms.models import modelform_factory
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.urls import path, reverse
+from django.core.serializers.json import DjangoJSONEncoder
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .views import BaseListPage, BaseFormPage
 
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+# QuerySet.iterator() ignores prefetch_related() before Django 4.1
+_ITERATOR_PREFETCHES = django.VERSION >= (4, 1)
+
+
+class _ListJsonResponse(JsonResponse):
+    # JsonResponse for list pages, encoded with orjson when it is installed
+    def __init__(self, data, encoder=DjangoJSONEncoder, safe=True, json_dumps_params=None, **kwargs):
+        if orjson is None:
+            super().__init__(data, encoder, safe, json_dumps_params, **kwargs)
+            return
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        # Datetimes go through the encoder so they are formatted as JsonResponse formats them
+        content = orjson.dumps(data, default=encoder().default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        HttpResponse.__init__(self, content=content, **kwargs)
+
+
+def _dumps(data):
+    # JSON bytes as _ListJsonResponse encodes them
+    if orjson is not None:
+        return orjson.dumps(data, default=DjangoJSONEncoder().default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+def _without_key(rows, key):
+    for row in rows:
+        del row[key]
+        yield row
+
+
+@lru_cache(maxsize=None)
+def _viewset_urls(viewset, prefix, base_name):
+    # URL patterns of a viewset, built once per prefix and base name however often the URLconf is imported
+    return tuple(viewset.build_urls(prefix, base_name))
+
+
+@lru_cache(maxsize=None)
+def _model_form_class(model, fields):
+    # ModelForm classes generated for viewsets without a form_class, built once per model and fields
+    return modelform_factory(model, fields=fields)
+
+
+@lru_cache(maxsize=None)
+def _many_to_many_names(model, fields):
+    # Many-to-many fields model_to_dict() includes, each read with one query per object unless prefetched
+    return tuple(
+        field.name for field in model._meta.many_to_many
+        if field.editable and (fields == '__all__' or field.name in fields)
+    )
+
+
+@lru_cache(maxsize=None)
+def _values_field_names(model, fields):
+    # Column fields model_to_dict() includes, or None when it also includes many-to-many fields
+    if _many_to_many_names(model, fields):
+        return None
+    return tuple(
+        field.name for field in model._meta.concrete_fields
+        if field.editable and (fields == '__all__' or field.name in fields)
+    )
+
+
+@lru_cache(maxsize=None)
+def _writable_field_names(model, fields):
+    # Names and attnames a JSON body may set, the same ones save(update_fields=...) accepts
+    return frozenset(chain.from_iterable(
+        (field.name, field.attname) for field in model._meta.concrete_fields
+        if not field.primary_key and (fields == '__all__' or field.name in fields)
+    ))
+
+
+@lru_cache(maxsize=None)
+def _auto_now_field_names(model):
+    # Timestamps save() refreshes on every write, so partial saves must include them
+    return tuple(field.name for field in model._meta.concrete_fields if getattr(field, 'auto_now', False))
+
+
+@lru_cache(maxsize=None)
+def _serializer(model, fields):
+    # Reads the fields model_to_dict() includes, resolved once per model and fields
+    def included(field):
+        return field.editable and (fields == '__all__' or field.name in fields)
+
+    opts = model._meta
+    getters = tuple(
+        (field.name, attrgetter(field.attname))
+        for field in opts.concrete_fields if included(field)
+    )
+    private = tuple(field for field in opts.private_fields if included(field))
+    many_to_many = _many_to_many_names(model, fields)
+
+    def serialize(obj):
+        data = {name: get(obj) for name, get in getters}
+        for field in private:
+            data[field.name] = field.value_from_object(obj)
+        # Related objects are sent as their primary keys
+        for name in many_to_many:
+            data[name] = [related.pk for related in getattr(obj, name).all()]
+        return data
+
+    return serialize
+
+
 def action(methods=None, detail=False, url_path=None, url_name=None):
     """
     Decorator to mark a method as a custom action.
@@ -42,12 +156,18 @@ def action(methods=None, detail=False, url_path=None, url_name=None):
         func.action_detail = detail
         func.action_url_path = url_path or func.__name__.replace('_', '-')
         func.action_url_name = url_name or func.__name__
+        # The settings packed once, as get_action_infos() hands them out
+        func.action_info = {
+            'methods': func.action_methods,
+            'detail': func.action_detail,
+            'url_path': func.action_url_path,
+            'url_name': func.action_url_name,
+        }
         return func
 
     return decorator
 
 
-@method_decorator(csrf_exempt, name='dispatch')
 class ModelViewSet(View):
     """
     A ViewSet-like class for handling CRUD operations on Django models.
@@ -62,6 +182,7 @@ class ModelViewSet(View):
             template_list = 'books/list.html'
             template_detail = 'books/detail.html'
             template_form = 'books/form.html'
+            template_delete = 'books/confirm_delete.html'
 
             def get_context_data(self, **kwargs):
                 context = super().get_context_data(**kwargs)
@@ -79,15 +200,23 @@ class ModelViewSet(View):
     filter_fields = '__all__'
     filter_form_method = 'get'
     filter_form_action = ''
+    # Save only the fields a JSON update sends. Leave off for models that derive other columns in save()
+    partial_json_save = False
 
     # Pagination
     paginate_by = None  # Number of items per page
+    stream_json = False  # Stream JSON lists as rows are serialized instead of building them in memory
+    iterator_chunk_size = None  # Rows fetched per chunk for unpaginated JSON lists (default 2000)
     page_kwarg = 'page'
+    cursor_pagination = False  # Page by cursor_field instead of page number, without counting
+    cursor_field = 'pk'
+    cursor_kwarg = 'cursor'
 
     # Template names
     template_list = None
     template_detail = None
     template_form = None
+    template_delete = None
 
     # URL naming
     base_name = None
@@ -95,56 +224,145 @@ class ModelViewSet(View):
     # Success URLs
     success_url = None
 
+    # Set by as_urls() on each view: the url's route, or the name of its custom action
+    route = None
+    action_name = None
+
+    # Handler for each (HTTP method, route) of the urls built by as_urls()
+    route_handlers = {
+        ('GET', 'list'): 'list',
+        ('POST', 'list'): 'create',
+        ('GET', 'create'): 'create_form',
+        ('POST', 'create'): 'create',
+        ('GET', 'detail'): 'retrieve',
+        ('POST', 'detail'): 'update',
+        ('PUT', 'detail'): 'update',
+        ('PATCH', 'detail'): 'partial_update',
+        ('DELETE', 'detail'): 'destroy',
+        ('GET', 'edit'): 'edit',
+        ('POST', 'edit'): 'update',
+        ('PUT', 'edit'): 'update',
+        ('PATCH', 'edit'): 'partial_update',
+        ('DELETE', 'edit'): 'destroy',
+        ('GET', 'delete'): 'delete_confirm',
+        ('POST', 'delete'): 'destroy',
+        ('PUT', 'delete'): 'update',
+        ('PATCH', 'delete'): 'partial_update',
+        ('DELETE', 'delete'): 'destroy',
+    }
+
     @classmethod
     def as_urls(cls, prefix='', base_name=None):
         """Generate URL patterns for all CRUD operations."""
         if base_name is None:
             base_name = cls.get_base_name()
 
+        # Copied so callers may extend the list without changing the cached patterns
+        return list(_viewset_urls(cls, prefix, base_name))
+
+    @classmethod
+    def build_urls(cls, prefix, base_name):
+        """Build the URL patterns returned by as_urls()."""
         prefix = prefix.strip('/') + '/' if prefix else ''
 
         urls = [
-            path(f'{prefix}', cls.as_view(), name=f'{base_name}-list'),
-            path(f'{prefix}create/', cls.as_view(), name=f'{base_name}-create'),
-            path(f'{prefix}<int:pk>/', cls.as_view(), name=f'{base_name}-detail'),
-            path(f'{prefix}<int:pk>/edit/', cls.as_view(), name=f'{base_name}-edit'),
-            path(f'{prefix}<int:pk>/delete/', cls.as_view(), name=f'{base_name}-delete'),
+            path(f'{prefix}', cls.as_view(route='list'), name=f'{base_name}-list'),
+            path(f'{prefix}create/', cls.as_view(route='create'), name=f'{base_name}-create'),
+            path(f'{prefix}<int:pk>/', cls.as_view(route='detail'), name=f'{base_name}-detail'),
+            path(f'{prefix}<int:pk>/edit/', cls.as_view(route='edit'), name=f'{base_name}-edit'),
+            path(f'{prefix}<int:pk>/delete/', cls.as_view(route='delete'), name=f'{base_name}-delete'),
         ]
 
         # Add custom action URLs
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name)
-            if callable(attr) and hasattr(attr, 'is_custom_action'):
-                url_path = attr.action_url_path
-                url_name = f"{base_name}-{attr.action_url_name}"
-                if attr.action_detail:
-                    urls.append(path(f'{prefix}<int:pk>/{url_path}/', cls.as_view(), name=url_name))
-                else:
-                    urls.append(path(f'{prefix}{url_path}/', cls.as_view(), name=url_name))
+        for action_info in cls.get_action_infos():
+            url_path = action_info['url_path']
+            url_name = f"{base_name}-{action_info['url_name']}"
+            view = cls.as_view(action_name=action_info['name'])
+            if action_info['detail']:
+                urls.append(path(f'{prefix}<int:pk>/{url_path}/', view, name=url_name))
+            else:
+                urls.append(path(f'{prefix}{url_path}/', view, name=url_name))
 
         return urls
 
+    @classmethod
+    def get_action_infos(cls):
+        """
+        Custom actions defined on the class, found once per class and reused by every request.
+        Each is a dict of the action's settings, with the method's ``name`` in place of the bound method.
+        """
+        actions = cls.__dict__.get('_action_infos')
+        if actions is None:
+            found = {}
+            # The first class in the MRO defining a name wins, as with getattr
+            for klass in cls.__mro__:
+                for attr_name, attr in vars(klass).items():
+                    if attr_name not in found:
+                        found[attr_name] = attr if callable(attr) and hasattr(attr, 'is_custom_action') else None
+
+            actions = tuple(
+                {'name': attr_name, **attr.action_info}
+                for attr_name, attr in sorted(found.items()) if attr is not None
+            )
+            cls._action_infos = actions
+
+        return actions
+
+    @classmethod
+    def get_path_suffixes(cls):
+        """
+        A regex matching the action or CRUD suffix a path ends with, and the actions by url_path,
+        built once per class for views not routed by as_urls().
+        """
+        suffixes = cls.__dict__.get('_path_suffixes')
+        if suffixes is None:
+            actions = {}
+            for action_info in cls.get_action_infos():
+                actions.setdefault(action_info['url_path'], action_info)
+            parts = [*actions, 'create', 'edit', 'delete']
+            pattern = re.compile(r'/(?P<suffix>%s)/?$' % '|'.join(map(re.escape, parts)))
+            suffixes = cls._path_suffixes = (pattern, actions)
+
+        return suffixes
+
     @classmethod
     def get_base_name(cls) -> Any:
         return cls.base_name or cls.model.__name__.lower()
 
     def accepts_html(self, request):
         """Check if client accepts HTML response."""
+        if request is getattr(self, 'request', None):
+            return self._accepts_html
         accept = request.META.get('HTTP_ACCEPT', '')
         return 'text/html' in accept or 'application/xhtml+xml' in accept
 
+    @cached_property
+    def _accepts_html(self):
+        # The Accept header is checked once per request, however many responses consult it
+        accept = self.request.META.get('HTTP_ACCEPT', '')
+        return 'text/html' in accept or 'application/xhtml+xml' in accept
+
+    @cached_property
+    def _fields_key(self):
+        # `fields` as a hashable key for the per-model caches above
+        return self.fields if self.fields == '__all__' else tuple(self.fields)
+
     def get_form_class(self):
         """Return the form class to use."""
         if self.form_class:
             return self.form_class
 
         # Auto-generate ModelForm
-        fields = self.fields if self.fields != '__all__' else None
-        return modelform_factory(self.model, fields=fields)
+        return _model_form_class(self.model, self._fields_key)
 
     def get_form_kwargs(self):
+        # Bound to the request body for writes, to the query string for filtering
+        if self.request.method in ('POST', 'PUT', 'PATCH'):
+            data = self.request.POST
+        else:
+            data = self.request.GET or None
         kwargs = {
-            'data': self.request.GET or self.request.POST or None,
+            'data': data,
         }
         if self.object:
             kwargs['instance'] = self.object
@@ -153,17 +371,29 @@ class ModelViewSet(View):
 
     def get_form(self, form_class=None):
         """Return an instance of the form."""
-        form_kwargs = self.get_form_kwargs()
-        if self.form_class:
-            return self.form_class(**form_kwargs)
-        # Auto-generate form from model fields
-        fields = self.fields if self.fields != '__all__' else None
-        form_class = modelform_factory(self.model, fields=fields)
-        return form_class(**form_kwargs)
+        form_class = form_class or self.get_form_class()
+        return form_class(**self.get_form_kwargs())
 
     def get_queryset(self):
         """Return the queryset. Override to add filtering."""
-        return self.model.objects.all()
+        queryset = self.model.objects.all()
+        many_to_many = self.get_many_to_many_fields()
+        if many_to_many:
+            queryset = queryset.prefetch_related(*many_to_many)
+        return queryset
+
+    def get_values_fields(self):
+        """
+        Fields for serializing lists with ``values()`` instead of model instances,
+        or None when ``serialize`` is customized or the fields include many-to-many relations.
+        """
+        if type(self).serialize is not ModelViewSet.serialize:
+            return None
+        return _values_field_names(self.model, self._fields_key)
+
+    def get_many_to_many_fields(self):
+        """Names of the serialized many-to-many fields, prefetched by get_queryset."""
+        return _many_to_many_names(self.model, self._fields_key)
 
     def filter_queryset(self, queryset=None, form=None):
         """Filter the queryset based on request parameters."""
@@ -176,6 +406,9 @@ class ModelViewSet(View):
 
     def paginate_queryset(self, queryset, page_size):
         """Paginate the queryset."""
+        if self.cursor_pagination:
+            return self.paginate_queryset_by_cursor(queryset, page_size)
+
         paginator = Paginator(queryset, page_size)
         page = self.request.GET.get(self.page_kwarg, 1)
 
@@ -193,6 +426,29 @@ class ModelViewSet(View):
             'object_list': page_obj.object_list,
         }
 
+    def paginate_queryset_by_cursor(self, queryset, page_size):
+        """Return the page of rows after the requested cursor, without OFFSET or COUNT."""
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        queryset = queryset.order_by(self.cursor_field)
+        if cursor:
+            try:
+                queryset = queryset.filter(**{f'{self.cursor_field}__gt': cursor})
+            except (ValueError, TypeError, ValidationError):
+                cursor = None
+
+        object_list = list(queryset[:page_size])
+        next_cursor = None
+        if len(object_list) == page_size:
+            last = object_list[-1]
+            next_cursor = last[self.cursor_field] if isinstance(last, dict) else getattr(last, self.cursor_field)
+
+        return {
+            'cursor': cursor,
+            'next_cursor': next_cursor,
+            'is_paginated': bool(cursor) or next_cursor is not None,
+            'object_list': object_list,
+        }
+
     def get_context_data(self, **kwargs):
         """
         Get context data for templates.
@@ -243,19 +499,22 @@ class ModelViewSet(View):
 
     def serialize(self, obj):
         """Convert model instance to dictionary."""
-        if self.fields == '__all__':
-            return model_to_dict(obj)
-        return model_to_dict(obj, fields=self.fields)
+        return _serializer(self.model, self._fields_key)(obj)
 
     def get_request_data(self, request):
         """Extract data from request (JSON or form data)."""
         if request.content_type == 'application/json':
             try:
-                return json.loads(request.body)
+                return _loads(request.body)
             except json.JSONDecodeError:
                 return None
         return None
 
+    def get_writable_data(self, json_data):
+        """Keep the model's concrete fields from a JSON body, limited to `fields` if set."""
+        names = _writable_field_names(self.model, self._fields_key)
+        return {key: value for key, value in json_data.items() if key in names}
+
     def error_response(self, request, message, status):
         """Return error in appropriate format."""
         if self.accepts_html(request):
@@ -264,43 +523,27 @@ class ModelViewSet(View):
 
     def render_to_response(self, context, template=None):
         """Unified response rendering method."""
-        if template:
-            return render(self.request, template, context)
-        
-        # Determine which render method to use based on context
-        if 'object_list' in context:
-            template = self.template_list
-        elif 'form' in context:
-            template = self.template_form
-        elif 'object' in context and 'form' not in context:
-            if context.get('action') == 'delete':
-                template = self.template_delete
-            else:
-                template = self.template_detail
-        else:
-            template = self.template_detail
-        
-        return render(self.request, template, context)
+        return render(self.request, template or self.template_detail, context)
 
     def get_object(self, pk):
         """Get a single object by pk. Raises ObjectDoesNotExist if not found."""
         self.object = self.get_queryset().get(**{self.lookup_field: pk})
         return self.object
 
+    def get_object_for_delete(self, pk):
+        """
+        Get the object for the delete confirmation page, without the many-to-many
+        prefetch get_queryset() adds for serializing.
+        """
+        self.object = self.get_queryset().prefetch_related(None).get(**{self.lookup_field: pk})
+        return self.object
+
     def get_custom_actions(self):
         """Return list of custom actions defined with @action decorator."""
-        actions = []
-        for attr_name in dir(self.__class__):
-            attr = getattr(self.__class__, attr_name)
-            if callable(attr) and hasattr(attr, 'is_custom_action'):
-                actions.append({
-                    'method': getattr(self, attr_name),
-                    'methods': attr.action_methods,
-                    'detail': attr.action_detail,
-                    'url_path': attr.action_url_path,
-                    'url_name': attr.action_url_name,
-                })
-        return actions
+        return [
+            {'method': getattr(self, action_info['name']), **action_info}
+            for action_info in self.get_action_infos()
+        ]
 
     def dispatch(self, request, *args, **kwargs):
         """Route requests to appropriate handler methods."""
@@ -312,40 +555,40 @@ class ModelViewSet(View):
         self.kwargs = kwargs
 
         pk = kwargs.get(self.lookup_field)
-        path_info = request.path_info
+
+        # Views built by as_urls() know their route and skip matching the path
+        if self.action_name is not None:
+            for action_info in self.get_action_infos():
+                if action_info['name'] == self.action_name:
+                    return self.call_action(request, action_info, pk)
+
+        handler = self.route_handlers.get((request.method, self.route))
+        if handler is not None:
+            handler = getattr(self, handler)
+            return handler(request) if pk is None else handler(request, pk)
+
+        pattern, actions = self.get_path_suffixes()
+        match = pattern.search(request.path_info)
+        suffix = match.group('suffix') if match else None
 
         # Check for custom actions first
-        custom_actions = self.get_custom_actions()
-        for action_info in custom_actions:
-            if action_info['url_path'] in path_info:
-                # Check if request method is allowed for this action
-                if request.method in action_info['methods']:
-                    # Check if it's a detail action that requires pk
-                    if action_info['detail'] and not pk:
-                        return self.error_response(request, 'ID required for this action', 400)
-
-                    # Call the custom action method
-                    if action_info['detail']:
-                        return action_info['method'](request, pk)
-                    else:
-                        return action_info['method'](request)
-                else:
-                    return self.error_response(request, f"Method {request.method} not allowed", 405)
+        if suffix in actions:
+            return self.call_action(request, actions[suffix], pk)
 
         # Standard CRUD operations
         if request.method == 'GET':
             if pk:
-                if 'edit' in path_info:
+                if suffix == 'edit':
                     return self.edit(request, pk)
-                elif 'delete' in path_info:
+                elif suffix == 'delete':
                     return self.delete_confirm(request, pk)
                 return self.retrieve(request, pk)
-            elif 'create' in path_info:
+            elif suffix == 'create':
                 return self.create_form(request)
             return self.list(request)
         elif request.method == 'POST':
             if pk:
-                if 'delete' in path_info:
+                if suffix == 'delete':
                     return self.destroy(request, pk)
                 return self.update(request, pk)
             return self.create(request)
@@ -364,6 +607,25 @@ class ModelViewSet(View):
 
         return self.error_response(request, 'Method not allowed', 405)
 
+    # as_view() copies this flag onto the view, exempting it from CSRF checks without wrapping dispatch
+    dispatch.csrf_exempt = True
+
+    def call_action(self, request, action_info, pk=None):
+        """Call a custom action, checking the request method and the pk of detail actions."""
+        # Check if request method is allowed for this action
+        if request.method not in action_info['methods']:
+            return self.error_response(request, f"Method {request.method} not allowed", 405)
+
+        # Check if it's a detail action that requires pk
+        if action_info['detail'] and not pk:
+            return self.error_response(request, 'ID required for this action', 400)
+
+        # Call the custom action method
+        method = getattr(self, action_info['name'])
+        if action_info['detail']:
+            return method(request, pk)
+        return method(request)
+
     def list(self, request):
         """GET request without ID - return all objects."""
         queryset = self.get_queryset()
@@ -373,8 +635,18 @@ class ModelViewSet(View):
         queryset = self.filter_queryset(queryset, form)
         context = {}
 
-        # Handle pagination
+        accepts_html = self.accepts_html(request)
+
+        # JSON lists fetch only the serialized fields, already as dicts
+        values_fields = None if accepts_html else self.get_values_fields()
         paginate_by = self.get_paginate_by()
+        by_cursor = bool(paginate_by) and self.cursor_pagination
+        # The cursor is read from the last row, so it is fetched even when not serialized
+        cursor_only = by_cursor and values_fields is not None and self.cursor_field not in values_fields
+        if values_fields is not None:
+            queryset = queryset.values(*values_fields, *((self.cursor_field,) if cursor_only else ()))
+
+        # Handle pagination
         if paginate_by:
             pagination_data = self.paginate_queryset(queryset, paginate_by)
             context.update(pagination_data)
@@ -386,18 +658,47 @@ class ModelViewSet(View):
         # Get action-specific context
         context = self.get_list_context_data(**context)
 
-        if self.accepts_html(request):
+        if accepts_html:
             return self.render_to_response(context, self.template_list)
 
         # JSON response
-        data = [self.serialize(obj) for obj in objects]
-        response = {'results': data, 'count': queryset.count()}
+        if not paginate_by and _ITERATOR_PREFETCHES:
+            # Unpaginated lists read the rows in chunks instead of caching them all on the queryset
+            objects = queryset.iterator(chunk_size=self.iterator_chunk_size or 2000)
+
+        if values_fields is None:
+            rows = map(self.serialize, objects)
+        elif cursor_only:
+            rows = _without_key(objects, self.cursor_field)
+        else:
+            rows = objects
+
+        # The paginator has already counted the rows; an unpaginated list is all of them
+        if by_cursor:
+            meta = {'next_cursor': context['next_cursor']}
+        elif paginate_by:
+            meta = {
+                'count': context['paginator'].count,
+                'page': context['page_obj'].number,
+                'total_pages': context['paginator'].num_pages,
+            }
+        else:
+            meta = None
 
-        if paginate_by:
-            response['page'] = context['page_obj'].number
-            response['total_pages'] = context['paginator'].num_pages
+        if self.stream_json:
+            return StreamingHttpResponse(self.stream_list_json(rows, meta), content_type='application/json')
+
+        data = list(rows)
+        return _ListJsonResponse({'results': data, **(meta or {'count': len(data)})}, safe=False)
 
-        return JsonResponse(response, safe=False)
+    def stream_list_json(self, rows, meta=None):
+        """Yield a JSON list response row by row, followed by `meta` or the count of rows sent."""
+        yield b'{"results":['
+        count = 0
+        for row in rows:
+            yield _dumps(row) if not count else b',' + _dumps(row)
+            count += 1
+        yield b'],' + _dumps(meta or {'count': count})[1:]
 
     def retrieve(self, request, pk):
         """GET request with ID - return single object."""
@@ -424,8 +725,7 @@ class ModelViewSet(View):
 
         if json_data:
             try:
-                if self.fields != '__all__':
-                    json_data = {k: v for k, v in json_data.items() if k in self.fields}
+                json_data = self.get_writable_data(json_data)
                 obj = self.model.objects.create(**json_data)
                 return JsonResponse(self.serialize(obj), status=201)
             except Exception as e:
@@ -454,7 +754,11 @@ class ModelViewSet(View):
             return self.error_response(request, 'Object not found', 404)
 
     def update(self, request, pk):
-        """PUT/POST request - update object."""
+        """
+        PUT/POST request - update object.
+        With partial_json_save, a JSON body saves only its own fields and auto_now timestamps. Columns that
+        save() or pre_save() would derive from other fields are then left as they are.
+        """
         try:
             obj = self.get_object(pk)
         except ObjectDoesNotExist:
@@ -464,11 +768,14 @@ class ModelViewSet(View):
 
         if json_data:
             try:
-                if self.fields != '__all__':
-                    json_data = {k: v for k, v in json_data.items() if k in self.fields}
+                json_data = self.get_writable_data(json_data)
                 for key, value in json_data.items():
                     setattr(obj, key, value)
-                obj.save()
+                if self.partial_json_save:
+                    # Only the columns sent are written, along with auto_now timestamps
+                    obj.save(update_fields=[*json_data, *_auto_now_field_names(self.model)])
+                else:
+                    obj.save()
                 return JsonResponse(self.serialize(obj))
             except Exception as e:
                 return self.error_response(request, str(e), 400)
@@ -492,9 +799,9 @@ class ModelViewSet(View):
     def delete_confirm(self, request, pk):
         """Show delete confirmation (HTML only)."""
         try:
-            obj = self.get_object(pk)
+            obj = self.get_object_for_delete(pk)
             context = self.get_delete_context_data(object=obj, action='delete')
-            return self.render_to_response(context)
+            return self.render_to_response(context, self.template_delete)
         except ObjectDoesNotExist:
             return self.error_response(request, 'Object not found', 404)
 
@@ -505,7 +812,7 @@ class ModelViewSet(View):
             obj.delete()
 
             if self.accepts_html(request):
-                base_name = self.base_name or self.model.__name__.lower()
+                base_name = self.get_base_name()
                 try:
                     return redirect(reverse(f'{base_name}-list'))
                 except:
@@ -529,33 +836,10 @@ class PageModelViewSet(BaseListPage, BaseFormPage, ModelViewSet):
 
     form_class = None
 
-    def get_form_class(self):
-        """Return the form class to use."""
-        if self.form_class:
-            return self.form_class
-
-        # Auto-generate ModelForm
-        fields = self.fields if self.fields != '__all__' else None
-        return modelform_factory(self.model, fields=fields)
-
-    def get_form_kwargs(self):
-        kwargs = {
-            'data': self.request.GET or self.request.POST or None,
-        }
-        if self.object:
-            kwargs['instance'] = self.object
-
-        return kwargs
-
-    def get_form(self, form_class=None):
-        """Return an instance of the form."""
-        form_kwargs = self.get_form_kwargs()
-        if self.form_class:
-            return self.form_class(**form_kwargs)
-        # Auto-generate form from model fields
-        fields = self.fields if self.fields != '__all__' else None
-        form_class = modelform_factory(self.model, fields=fields)
-        return form_class(**form_kwargs)
+    # The page mixins earlier in the MRO build filter forms; viewset forms come from ModelViewSet
+    get_form_class = ModelViewSet.get_form_class
+    get_form_kwargs = ModelViewSet.get_form_kwargs
+    get_form = ModelViewSet.get_form
 
     def list(self, request):
         self.show_field_labels = False
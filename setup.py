@@ -9,6 +9,9 @@ setup(
         'laces>=0.1.2',
         'django-widget-tweaks>=1.5.1',
     ],
+    extras_require={
+        'orjson': ['orjson>=3.6'],
+    },
     author='Antwi Kwarteng',
     description='Reusable Django components for building web applications',
     python_requires='>=3.8',